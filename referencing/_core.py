@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Iterator, Sequence
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, ClassVar, Generic, Protocol
-from urllib.parse import unquote, urldefrag, urljoin
+from urllib.parse import unquote, urljoin
 
 from attrs import evolve, field
-from rpds import HashTrieMap, HashTrieSet, List
+from rpds import HashTrieMap, HashTrieSet
 
 try:
     from typing_extensions import TypeVar
@@ -18,7 +19,7 @@ from referencing._attrs import frozen
 from referencing.typing import URI, Anchor as AnchorType, D, Mapping, Retrieve
 
 EMPTY_UNCRAWLED: HashTrieSet[URI] = HashTrieSet()
-EMPTY_PREVIOUS_RESOLVERS: List[URI] = List()
+EMPTY_PREVIOUS_RESOLVERS: tuple[URI, ...] = ()
 
 
 class _Unset(Enum):
@@ -41,6 +42,46 @@ class _MaybeInSubresource(Protocol[D]):
     ) -> Resolver[D]: ...
 
 
+@lru_cache(maxsize=2048)
+def _pointer_segments(pointer: str) -> tuple[str, ...]:
+    """
+    Split a (non-empty) JSON pointer into its unescaped segments.
+    """
+    return tuple(
+        segment.replace("~1", "/").replace("~0", "~")
+        if "~" in segment
+        else segment
+        for segment in unquote(pointer[1:]).split("/")
+    )
+
+
+@lru_cache(maxsize=4096)
+def _urljoin(base: URI, url: URI) -> URI:
+    """
+    Join a URI reference to a base URI, remembering recent results.
+
+    The same references tend to be resolved against the same few base URIs
+    over and over, and ``urljoin`` itself is comparatively expensive.
+    """
+    return urljoin(base, url)
+
+
+@lru_cache(maxsize=32)
+def _specification_with(dialect_id: URI) -> Specification[Any] | None:
+    """
+    Look up the JSON Schema specification with the given dialect ID, if any.
+
+    Nearly all resources use one of a handful of dialect IDs, so cache them
+    (which also saves re-running the import below for each resource).
+    """
+    from referencing.jsonschema import UnknownDialect, specification_with
+
+    try:
+        return specification_with(dialect_id)
+    except UnknownDialect:
+        return None
+
+
 def _detect_or_error(contents: D) -> Specification[D]:
     if not isinstance(contents, Mapping):
         raise exceptions.CannotDetermineSpecification(contents)
@@ -49,11 +90,15 @@ def _detect_or_error(contents: D) -> Specification[D]:
     if not isinstance(jsonschema_dialect_id, str):
         raise exceptions.CannotDetermineSpecification(contents)
 
-    from referencing.jsonschema import specification_with
+    specification = _specification_with(jsonschema_dialect_id)
+    if specification is None:
+        from referencing.jsonschema import UnknownDialect
 
-    return specification_with(jsonschema_dialect_id)
+        raise UnknownDialect(jsonschema_dialect_id)
+    return specification
 
 
+@lru_cache(maxsize=32)
 def _detect_or_default(
     default: Specification[D],
 ) -> Callable[[D], Specification[D]]:
@@ -65,12 +110,8 @@ def _detect_or_default(
         if jsonschema_dialect_id is None:
             return default
 
-        from referencing.jsonschema import specification_with
-
-        return specification_with(
-            jsonschema_dialect_id,  # type: ignore[reportUnknownArgumentType]
-            default=default,
-        )
+        specification = _specification_with(jsonschema_dialect_id)  # type: ignore[reportUnknownArgumentType]
+        return default if specification is None else specification
 
     return _detect
 
@@ -266,12 +307,11 @@ class Resource(Generic[D]):
             return Resolved(contents=self.contents, resolver=resolver)
 
         contents = self.contents
+        specification = self._specification
         segments: list[int | str] = []
-        for segment in unquote(pointer[1:]).split("/"):
+        for segment in _pointer_segments(pointer):
             if isinstance(contents, Sequence):
                 segment = int(segment)
-            else:
-                segment = segment.replace("~1", "/").replace("~0", "~")
             try:
                 contents = contents[segment]  # type: ignore[reportUnknownArgumentType]
             except LookupError as lookup_error:
@@ -280,10 +320,10 @@ class Resource(Generic[D]):
 
             segments.append(segment)
             last = resolver
-            resolver = self._specification.maybe_in_subresource(
+            resolver = specification.maybe_in_subresource(
                 segments=segments,
                 resolver=resolver,
-                subresource=self._specification.create_resource(contents),
+                subresource=specification.create_resource(contents),
             )
             if resolver is not last:
                 segments = []
@@ -349,6 +389,24 @@ class Registry(Mapping[URI, Resource[D]]):
         """
         return len(self._resources)
 
+    def __eq__(self, other: object) -> bool:
+        # Comparing the underlying maps compares every resource's contents, so
+        # avoid doing so when comparing a registry (or its maps) to itself.
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()  # type: ignore[reportUnknownMemberType]
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self):
+        """
+        The fields which determine a registry's equality and hash.
+        """
+        return self._resources, self._anchors, self._uncrawled, self._retrieve
+
     def __rmatmul__(
         self,
         new: Resource[D] | Iterable[Resource[D]],
@@ -419,7 +477,7 @@ class Registry(Mapping[URI, Resource[D]]):
         if resource is not None:
             return Retrieved(registry=self, value=resource)
 
-        registry = self.crawl()
+        registry = self.crawl(until=uri)
         resource = registry._resources.get(uri)
         if resource is not None:
             return Retrieved(registry=registry, value=resource)
@@ -487,35 +545,65 @@ class Registry(Mapping[URI, Resource[D]]):
         """
         return self[uri].contents
 
-    def crawl(self) -> Registry[D]:
+    def crawl(self, until: URI | None = None) -> Registry[D]:
         """
         Crawl all added resources, discovering subresources.
+
+        If ``until`` is given, crawling stops as soon as a resource with that
+        URI has been found, leaving any added resources which haven't been
+        reached yet uncrawled.
         """
+        if not self._uncrawled or until in self._resources:
+            return self
+
         resources = self._resources
         anchors = self._anchors
-        uncrawled = [(uri, resources[uri]) for uri in self._uncrawled]
-        while uncrawled:
-            uri, resource = uncrawled.pop()
+        remaining = self._uncrawled
+        for root in self._uncrawled:
+            uncrawled = [(root, self._resources[root])]
+            while uncrawled:
+                uri, resource = uncrawled.pop()
+
+                id = resource.id()
+                if id is not None:
+                    uri = _urljoin(uri, id)
+                    resources = resources.insert(uri, resource)
+
+                # Walk anchors and subresources straight from the
+                # specification, rather than through Resource methods.
+                specification = resource._specification  # type: ignore[reportPrivateUsage]
+                contents = resource.contents
+                for each in specification.anchors_in(contents):
+                    anchors = anchors.insert((uri, each.name), each)
+                for each in specification.subresources_of(contents):
+                    subresource = Resource.from_contents(
+                        each,
+                        default_specification=specification,
+                    )
+                    uncrawled.append((uri, subresource))
 
-            id = resource.id()
-            if id is not None:
-                uri = urljoin(uri, id)
-                resources = resources.insert(uri, resource)
-            for each in resource.anchors():
-                anchors = anchors.insert((uri, each.name), each)
-            uncrawled.extend((uri, each) for each in resource.subresources())
+            if until is not None:
+                remaining = remaining.remove(root)
+                if until in resources:
+                    break
         return evolve(
             self,
             resources=resources,
             anchors=anchors,
-            uncrawled=EMPTY_UNCRAWLED,
+            uncrawled=EMPTY_UNCRAWLED if until is None else remaining,
         )
 
     def with_resource(self, uri: URI, resource: Resource[D]):
         """
         Add the given `Resource` to the registry, without crawling it.
         """
-        return self.with_resources([(uri, resource)])
+        # Empty fragment URIs are equivalent to URIs without the fragment.
+        uri = uri.rstrip("#")
+        return evolve(
+            self,
+            resources=self._resources.insert(uri, resource),
+            uncrawled=self._uncrawled.insert(uri),
+        )
 
     def with_resources(
         self,
@@ -524,15 +612,15 @@ class Registry(Mapping[URI, Resource[D]]):
         r"""
         Add the given `Resource`\ s to the registry, without crawling them.
         """
-        resources = self._resources
-        uncrawled = self._uncrawled
-        for uri, resource in pairs:
-            # Empty fragment URIs are equivalent to URIs without the fragment.
-            # TODO: Is this true for non JSON Schema resources? Probably not.
-            uri = uri.rstrip("#")
-            uncrawled = uncrawled.insert(uri)
-            resources = resources.insert(uri, resource)
-        return evolve(self, resources=resources, uncrawled=uncrawled)
+        # Empty fragment URIs are equivalent to URIs without the fragment.
+        # TODO: Is this true for non JSON Schema resources? Probably not.
+        # Collect everything first, and then insert it all in one bulk update.
+        new = {uri.rstrip("#"): resource for uri, resource in pairs}
+        return evolve(
+            self,
+            resources=self._resources.update(new),
+            uncrawled=self._uncrawled.update(new),
+        )
 
     def with_contents(
         self,
@@ -551,7 +639,9 @@ class Registry(Mapping[URI, Resource[D]]):
         """
         Combine together one or more other registries, producing a unified one.
         """
-        if registries == (self,):
+        # Check identity only -- comparing registries for equality compares
+        # every resource they contain, which costs more than combining them.
+        if len(registries) == 1 and registries[0] is self:
             return self
         resources = self._resources
         anchors = self._anchors
@@ -648,7 +738,11 @@ class Resolver(Generic[D]):
 
     _base_uri: URI = field(alias="base_uri")
     _registry: Registry[D] = field(alias="registry")
-    _previous: List[URI] = field(default=List(), repr=False, alias="previous")
+    _previous: tuple[URI, ...] = field(
+        default=EMPTY_PREVIOUS_RESOLVERS,
+        repr=False,
+        alias="previous",
+    )
 
     def lookup(self, ref: URI) -> Resolved[D]:
         """
@@ -677,7 +771,7 @@ class Resolver(Generic[D]):
         if ref.startswith("#"):
             uri, fragment = self._base_uri, ref[1:]
         else:
-            uri, fragment = urldefrag(urljoin(self._base_uri, ref))
+            uri, _, fragment = _urljoin(self._base_uri, ref).partition("#")
         try:
             retrieved = self._registry.get_or_retrieve(uri)
         except exceptions.NoSuchResource:
@@ -704,7 +798,7 @@ class Resolver(Generic[D]):
         id = subresource.id()
         if id is None:
             return self
-        return evolve(self, base_uri=urljoin(self._base_uri, id))
+        return evolve(self, base_uri=_urljoin(self._base_uri, id))
 
     def dynamic_scope(self) -> Iterable[tuple[URI, Registry[D]]]:
         """
@@ -719,7 +813,7 @@ class Resolver(Generic[D]):
         """
         previous = self._previous
         if self._base_uri and (not previous or base_uri != self._base_uri):
-            previous = previous.push_front(self._base_uri)
+            previous = (self._base_uri, *previous)
         return evolve(self, base_uri=base_uri, previous=previous, **kwargs)
 
 
@@ -50,20 +50,18 @@ def _dollar_id(contents: Schema) -> URI | None:
     return contents.get("$id")
 
 
-def _legacy_dollar_id(contents: Schema) -> URI | None:
-    if isinstance(contents, bool) or "$ref" in contents:
-        return
-    id = contents.get("$id")
-    if id is not None and not id.startswith("#"):
-        return id
+def _legacy_id_of(keyword: str):
+    def id_of(contents: Schema) -> URI | None:
+        if isinstance(contents, bool) or "$ref" in contents:
+            return
+        id = contents.get(keyword)
+        if id is not None and not id.startswith("#"):
+            return id
 
+    return id_of
 
-def _legacy_id(contents: ObjectSchema) -> URI | None:
-    if "$ref" in contents:
-        return
-    id = contents.get("id")
-    if id is not None and not id.startswith("#"):
-        return id
+
+_ANCHOR_KEYWORDS = frozenset({"$anchor", "$dynamicAnchor"})
 
 
 def _anchor(
@@ -71,20 +69,21 @@ def _anchor(
     contents: Schema,
 ) -> Iterable[AnchorType[Schema]]:
     if isinstance(contents, bool):
-        return
+        return ()
+    if contents.keys().isdisjoint(_ANCHOR_KEYWORDS):
+        return ()
+
+    # Both kinds of anchor point at this same subschema, so share one resource.
+    resource = specification.create_resource(contents)
+    anchors: list[AnchorType[Schema]] = []
     anchor = contents.get("$anchor")
     if anchor is not None:
-        yield Anchor(
-            name=anchor,
-            resource=specification.create_resource(contents),
-        )
+        anchors.append(Anchor(name=anchor, resource=resource))
 
     dynamic_anchor = contents.get("$dynamicAnchor")
     if dynamic_anchor is not None:
-        yield DynamicAnchor(
-            name=dynamic_anchor,
-            resource=specification.create_resource(contents),
-        )
+        anchors.append(DynamicAnchor(name=dynamic_anchor, resource=resource))
+    return anchors
 
 
 def _anchor_2019(
@@ -92,187 +91,96 @@ def _anchor_2019(
     contents: Schema,
 ) -> Iterable[Anchor[Schema]]:
     if isinstance(contents, bool):
-        return []
+        return ()
     anchor = contents.get("$anchor")
     if anchor is None:
-        return []
-    return [
+        return ()
+    return (
         Anchor(
             name=anchor,
             resource=specification.create_resource(contents),
         ),
-    ]
+    )
 
 
-def _legacy_anchor_in_dollar_id(
-    specification: Specification[Schema],
-    contents: Schema,
-) -> Iterable[Anchor[Schema]]:
-    if isinstance(contents, bool):
-        return []
-    id = contents.get("$id", "")
-    if not id.startswith("#"):
-        return []
-    return [
-        Anchor(
-            name=id[1:],
-            resource=specification.create_resource(contents),
-        ),
-    ]
-
+def _legacy_anchor_in(keyword: str):
+    def anchors_in(
+        specification: Specification[Schema],
+        contents: Schema,
+    ) -> Iterable[Anchor[Schema]]:
+        if isinstance(contents, bool):
+            return ()
+        id = contents.get(keyword)
+        if id is None or not id.startswith("#"):
+            return ()
+        return (
+            Anchor(
+                name=id[1:],
+                resource=specification.create_resource(contents),
+            ),
+        )
 
-def _legacy_anchor_in_id(
-    specification: Specification[ObjectSchema],
-    contents: ObjectSchema,
-) -> Iterable[Anchor[ObjectSchema]]:
-    id = contents.get("id", "")
-    if not id.startswith("#"):
-        return []
-    return [
-        Anchor(
-            name=id[1:],
-            resource=specification.create_resource(contents),
-        ),
-    ]
+    return anchors_in
 
 
 def _subresources_of(
+    *,
     in_value: Set[str] = frozenset(),
     in_subvalues: Set[str] = frozenset(),
     in_subarray: Set[str] = frozenset(),
+    in_value_or_subarray: Set[str] = frozenset(),
+    in_value_if_mapping: Set[str] = frozenset(),
+    in_subvalues_if_mappings: Set[str] = frozenset(),
 ):
     """
     Create a callable returning JSON Schema specification-style subschemas.
 
     Relies on specifying the set of keywords containing subschemas in their
     values, in a subobject's values, or in a subarray.
-    """
-
-    def subresources_of(contents: Schema) -> Iterable[ObjectSchema]:
-        if isinstance(contents, bool):
-            return
-        for each in in_value:
-            if each in contents:
-                yield contents[each]
-        for each in in_subarray:
-            if each in contents:
-                yield from contents[each]
-        for each in in_subvalues:
-            if each in contents:
-                yield from contents[each].values()
-
-    return subresources_of
-
-
-def _subresources_of_with_crazy_items(
-    in_value: Set[str] = frozenset(),
-    in_subvalues: Set[str] = frozenset(),
-    in_subarray: Set[str] = frozenset(),
-):
-    """
-    Specifically handle older drafts where there are some funky keywords.
-    """
-
-    def subresources_of(contents: Schema) -> Iterable[ObjectSchema]:
-        if isinstance(contents, bool):
-            return
-        for each in in_value:
-            if each in contents:
-                yield contents[each]
-        for each in in_subarray:
-            if each in contents:
-                yield from contents[each]
-        for each in in_subvalues:
-            if each in contents:
-                yield from contents[each].values()
-
-        items = contents.get("items")
-        if items is not None:
-            if isinstance(items, Sequence):
-                yield from items
-            else:
-                yield items
-
-    return subresources_of
-
 
-def _subresources_of_with_crazy_items_dependencies(
-    in_value: Set[str] = frozenset(),
-    in_subvalues: Set[str] = frozenset(),
-    in_subarray: Set[str] = frozenset(),
-):
-    """
-    Specifically handle older drafts where there are some funky keywords.
+    Older drafts additionally have some funky keywords, whose values are
+    either a subschema or a subarray (``items``), are only a subschema when
+    they are a mapping (e.g. draft 4's ``additionalProperties``), or have
+    subschemas in their subobject's values only when those are mappings
+    (``dependencies``).
     """
-
-    def subresources_of(contents: Schema) -> Iterable[ObjectSchema]:
+    keywords = frozenset(in_value).union(
+        in_subvalues,
+        in_subarray,
+        in_value_or_subarray,
+        in_value_if_mapping,
+        in_subvalues_if_mappings,
+    )
+
+    def subresources_of(contents: Schema) -> Iterable[Schema]:
         if isinstance(contents, bool):
-            return
-        for each in in_value:
-            if each in contents:
-                yield contents[each]
-        for each in in_subarray:
-            if each in contents:
-                yield from contents[each]
-        for each in in_subvalues:
-            if each in contents:
-                yield from contents[each].values()
-
-        items = contents.get("items")
-        if items is not None:
-            if isinstance(items, Sequence):
-                yield from items
-            else:
-                yield items
-        dependencies = contents.get("dependencies")
-        if dependencies is not None:
-            values = iter(dependencies.values())
-            value = next(values, None)
-            if isinstance(value, Mapping):
-                yield value
-                yield from values
-
-    return subresources_of
-
-
-def _subresources_of_with_crazy_aP_items_dependencies(
-    in_value: Set[str] = frozenset(),
-    in_subvalues: Set[str] = frozenset(),
-    in_subarray: Set[str] = frozenset(),
-):
-    """
-    Specifically handle even older drafts where there are some funky keywords.
-    """
-
-    def subresources_of(contents: ObjectSchema) -> Iterable[ObjectSchema]:
-        for each in in_value:
-            if each in contents:
-                yield contents[each]
-        for each in in_subarray:
-            if each in contents:
-                yield from contents[each]
-        for each in in_subvalues:
-            if each in contents:
-                yield from contents[each].values()
-
-        items = contents.get("items")
-        if items is not None:
-            if isinstance(items, Sequence):
-                yield from items
-            else:
-                yield items
-        dependencies = contents.get("dependencies")
-        if dependencies is not None:
-            values = iter(dependencies.values())
-            value = next(values, None)
-            if isinstance(value, Mapping):
-                yield value
-                yield from values
-
-        for each in "additionalItems", "additionalProperties":
-            value = contents.get(each)
-            if isinstance(value, Mapping):
-                yield value
+            return ()
+        subresources: list[Schema] = []
+        for each in contents.keys() & keywords:
+            value: Any = contents[each]
+            if each in in_value:
+                subresources.append(value)
+            elif each in in_subvalues:
+                subresources.extend(value.values())
+            elif each in in_subarray:
+                subresources.extend(value)
+            elif each in in_value_or_subarray:
+                # JSON arrays are virtually always lists, so check for those
+                # before paying for a (comparatively slow) ABC isinstance.
+                if type(value) is list or isinstance(value, Sequence):
+                    subresources.extend(value)  # type: ignore[reportUnknownArgumentType]
+                elif value is not None:
+                    subresources.append(value)
+            elif each in in_value_if_mapping:
+                if isinstance(value, Mapping):
+                    subresources.append(value)  # type: ignore[reportUnknownArgumentType]
+            elif value is not None:
+                values = iter(value.values())
+                first = next(values, None)
+                if isinstance(first, Mapping):
+                    subresources.append(first)  # type: ignore[reportUnknownArgumentType]
+                    subresources.extend(values)
+        return subresources
 
     return subresources_of
 
@@ -412,7 +320,7 @@ DRAFT202012 = Specification(
 DRAFT201909 = Specification(
     name="draft2019-09",
     id_of=_dollar_id,
-    subresources_of=_subresources_of_with_crazy_items(
+    subresources_of=_subresources_of(
         in_value={
             "additionalItems",
             "additionalProperties",
@@ -434,6 +342,7 @@ DRAFT201909 = Specification(
             "patternProperties",
             "properties",
         },
+        in_value_or_subarray={"items"},
     ),
     anchors_in=_anchor_2019,
     maybe_in_subresource=_maybe_in_subresource_crazy_items(
@@ -463,8 +372,8 @@ DRAFT201909 = Specification(
 #: JSON Schema draft 7
 DRAFT7 = Specification(
     name="draft-07",
-    id_of=_legacy_dollar_id,
-    subresources_of=_subresources_of_with_crazy_items_dependencies(
+    id_of=_legacy_id_of("$id"),
+    subresources_of=_subresources_of(
         in_value={
             "additionalItems",
             "additionalProperties",
@@ -477,8 +386,10 @@ DRAFT7 = Specification(
         },
         in_subarray={"allOf", "anyOf", "oneOf"},
         in_subvalues={"definitions", "patternProperties", "properties"},
+        in_value_or_subarray={"items"},
+        in_subvalues_if_mappings={"dependencies"},
     ),
-    anchors_in=_legacy_anchor_in_dollar_id,
+    anchors_in=_legacy_anchor_in("$id"),
     maybe_in_subresource=_maybe_in_subresource_crazy_items_dependencies(
         in_value={
             "additionalItems",
@@ -497,8 +408,8 @@ DRAFT7 = Specification(
 #: JSON Schema draft 6
 DRAFT6 = Specification(
     name="draft-06",
-    id_of=_legacy_dollar_id,
-    subresources_of=_subresources_of_with_crazy_items_dependencies(
+    id_of=_legacy_id_of("$id"),
+    subresources_of=_subresources_of(
         in_value={
             "additionalItems",
             "additionalProperties",
@@ -508,8 +419,10 @@ DRAFT6 = Specification(
         },
         in_subarray={"allOf", "anyOf", "oneOf"},
         in_subvalues={"definitions", "patternProperties", "properties"},
+        in_value_or_subarray={"items"},
+        in_subvalues_if_mappings={"dependencies"},
     ),
-    anchors_in=_legacy_anchor_in_dollar_id,
+    anchors_in=_legacy_anchor_in("$id"),
     maybe_in_subresource=_maybe_in_subresource_crazy_items_dependencies(
         in_value={
             "additionalItems",
@@ -525,13 +438,16 @@ DRAFT6 = Specification(
 #: JSON Schema draft 4
 DRAFT4 = Specification(
     name="draft-04",
-    id_of=_legacy_id,
-    subresources_of=_subresources_of_with_crazy_aP_items_dependencies(
+    id_of=_legacy_id_of("id"),
+    subresources_of=_subresources_of(
         in_value={"not"},
         in_subarray={"allOf", "anyOf", "oneOf"},
         in_subvalues={"definitions", "patternProperties", "properties"},
+        in_value_or_subarray={"items"},
+        in_value_if_mapping={"additionalItems", "additionalProperties"},
+        in_subvalues_if_mappings={"dependencies"},
     ),
-    anchors_in=_legacy_anchor_in_id,
+    anchors_in=_legacy_anchor_in("id"),
     maybe_in_subresource=_maybe_in_subresource_crazy_items_dependencies(
         in_value={"additionalItems", "additionalProperties", "not"},
         in_subarray={"allOf", "anyOf", "oneOf"},
@@ -541,12 +457,15 @@ DRAFT4 = Specification(
 #: JSON Schema draft 3
 DRAFT3 = Specification(
     name="draft-03",
-    id_of=_legacy_id,
-    subresources_of=_subresources_of_with_crazy_aP_items_dependencies(
+    id_of=_legacy_id_of("id"),
+    subresources_of=_subresources_of(
         in_subarray={"extends"},
         in_subvalues={"definitions", "patternProperties", "properties"},
+        in_value_or_subarray={"items"},
+        in_value_if_mapping={"additionalItems", "additionalProperties"},
+        in_subvalues_if_mappings={"dependencies"},
     ),
-    anchors_in=_legacy_anchor_in_id,
+    anchors_in=_legacy_anchor_in("id"),
     maybe_in_subresource=_maybe_in_subresource_crazy_items_dependencies(
         in_value={"additionalItems", "additionalProperties"},
         in_subarray={"extends"},
@@ -555,19 +474,20 @@ DRAFT3 = Specification(
 )
 
 
-_SPECIFICATIONS: Registry[Specification[Schema]] = Registry(
-    {
-        dialect_id: Resource.opaque(specification)
-        for dialect_id, specification in [
-            ("https://json-schema.org/draft/2020-12/schema", DRAFT202012),
-            ("https://json-schema.org/draft/2019-09/schema", DRAFT201909),
-            ("http://json-schema.org/draft-07/schema", DRAFT7),
-            ("http://json-schema.org/draft-06/schema", DRAFT6),
-            ("http://json-schema.org/draft-04/schema", DRAFT4),
-            ("http://json-schema.org/draft-03/schema", DRAFT3),
-        ]
-    },
-)
+# Dialect IDs are conventionally written both with and without an empty
+# fragment, so store both spellings to make the common case one dict lookup.
+_SPECIFICATIONS: Mapping[URI, Specification[Schema]] = {
+    dialect_id + fragment: specification
+    for dialect_id, specification in [
+        ("https://json-schema.org/draft/2020-12/schema", DRAFT202012),
+        ("https://json-schema.org/draft/2019-09/schema", DRAFT201909),
+        ("http://json-schema.org/draft-07/schema", DRAFT7),
+        ("http://json-schema.org/draft-06/schema", DRAFT6),
+        ("http://json-schema.org/draft-04/schema", DRAFT4),
+        ("http://json-schema.org/draft-03/schema", DRAFT3),
+    ]
+    for fragment in ("", "#")
+}
 
 
 def specification_with(
@@ -584,9 +504,11 @@ def specification_with(
             if the given ``dialect_id`` isn't known
 
     """
-    resource = _SPECIFICATIONS.get(dialect_id.rstrip("#"))
-    if resource is not None:
-        return resource.contents
+    specification = _SPECIFICATIONS.get(dialect_id)
+    if specification is None:
+        specification = _SPECIFICATIONS.get(dialect_id.rstrip("#"))
+    if specification is not None:
+        return specification
     if default is _UNSET:
         raise UnknownDialect(dialect_id)
     return default
@@ -605,13 +527,14 @@ class DynamicAnchor:
         """
         Resolve this anchor dynamically.
         """
-        last = self.resource
+        name, last = self.name, self.resource
         for uri, registry in resolver.dynamic_scope():
             try:
-                anchor = registry.anchor(uri, self.name).value
+                anchor = registry.anchor(uri, name).value
             except exceptions.NoSuchAnchor:
                 continue
-            if isinstance(anchor, DynamicAnchor):
+            # DynamicAnchor cannot be subclassed, so compare types directly.
+            if type(anchor) is DynamicAnchor:
                 last = anchor.resource
         return _Resolved(
             contents=last.contents,
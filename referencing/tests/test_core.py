@@ -1,3 +1,4 @@
+from attrs import evolve
 from rpds import HashTrieMap
 import pytest
 
@@ -134,6 +135,11 @@ class TestRegistry:
         registry = Registry({uri: resource}).crawl()
         assert registry[uri] is resource
 
+    def test_crawl_already_crawled(self):
+        resource = ID_AND_CHILDREN.create_resource({"children": [{}]})
+        registry = Registry().with_resource("urn:example", resource).crawl()
+        assert registry.crawl() is registry
+
     def test_crawl_finds_a_subresource(self):
         child_id = "urn:child"
         root = ID_AND_CHILDREN.create_resource(
@@ -146,6 +152,32 @@ class TestRegistry:
         expected = ID_AND_CHILDREN.create_resource({"ID": child_id, "foo": 12})
         assert registry.crawl()[child_id] == expected
 
+    def test_crawl_until(self):
+        child = {"ID": "urn:child", "foo": 12}
+        one = ID_AND_CHILDREN.create_resource({"children": [child]})
+        two = ID_AND_CHILDREN.create_resource({"children": [child]})
+        registry = Registry().with_resources(
+            [("urn:one", one), ("urn:two", two)],
+        )
+
+        crawled = registry.crawl(until="urn:child")
+        assert crawled["urn:child"] == ID_AND_CHILDREN.create_resource(child)
+        assert len(crawled._uncrawled) == 1
+        assert crawled.crawl() == registry.crawl()
+
+    def test_crawl_until_already_present(self):
+        one = ID_AND_CHILDREN.create_resource({"children": [{"ID": "urn:a"}]})
+        two = ID_AND_CHILDREN.create_resource({"children": [{"ID": "urn:b"}]})
+        registry = Registry().with_resources(
+            [("urn:one", one), ("urn:two", two)],
+        )
+        assert registry.crawl(until="urn:one") is registry
+
+    def test_crawl_until_not_found(self):
+        resource = ID_AND_CHILDREN.create_resource({"foo": 12})
+        registry = Registry().with_resource("urn:example", resource)
+        assert registry.crawl(until="urn:missing") == registry.crawl()
+
     def test_crawl_finds_anchors_with_id(self):
         resource = ID_AND_CHILDREN.create_resource(
             {"ID": "urn:bar", "anchors": {"foo": 12}},
@@ -255,6 +287,31 @@ class TestRegistry:
             .crawl()
         )
 
+    def test_eq_self(self):
+        resource = ID_AND_CHILDREN.create_resource({"foo": "bar"})
+        registry = Registry().with_resource("urn:example", resource)
+        assert registry == registry
+        assert registry != Registry()
+
+    def test_eq_self_does_not_compare_contents(self):
+        class Incomparable:
+            def __eq__(self, other):  # pragma: no cover
+                raise RuntimeError("contents should not be compared")
+
+            __hash__ = object.__hash__
+
+        resource = Resource.opaque(contents=Incomparable())
+        registry = Registry().with_resource("urn:example", resource)
+        assert registry == registry
+        assert registry == evolve(registry)
+        assert hash(registry) == hash(evolve(registry))
+
+    def test_eq_other_type(self):
+        assert Registry() != {}
+
+    def test_hash(self):
+        assert hash(Registry()) == hash(Registry())
+
     def test_no_such_resource(self):
         registry = Registry()
         with pytest.raises(exceptions.NoSuchResource) as e:
@@ -681,6 +738,12 @@ class TestResource:
         resolver = Registry().resolver()
         assert resource.pointer("/foo/bar/0", resolver=resolver).contents == 3
 
+    def test_pointer_with_escapes(self):
+        resource = Resource.opaque(contents={"foo/bar": {"~baz": {"~1": 3}}})
+        resolver = Registry().resolver()
+        resolved = resource.pointer("/foo~1bar/~0baz/~01", resolver=resolver)
+        assert resolved.contents == 3
+
     def test_root_pointer(self):
         contents = {"foo": "baz"}
         resource = Resource.opaque(contents=contents)
@@ -72,6 +72,8 @@ def test_id_of_mapping(id, specification):
         referencing.jsonschema.DRAFT201909,
         referencing.jsonschema.DRAFT7,
         referencing.jsonschema.DRAFT6,
+        referencing.jsonschema.DRAFT4,
+        referencing.jsonschema.DRAFT3,
     ],
 )
 @pytest.mark.parametrize("value", [True, False])
@@ -86,6 +88,8 @@ def test_id_of_bool(specification, value):
         referencing.jsonschema.DRAFT201909,
         referencing.jsonschema.DRAFT7,
         referencing.jsonschema.DRAFT6,
+        referencing.jsonschema.DRAFT4,
+        referencing.jsonschema.DRAFT3,
     ],
 )
 @pytest.mark.parametrize("value", [True, False])
@@ -93,6 +97,23 @@ def test_anchors_in_bool(specification, value):
     assert list(specification.anchors_in(value)) == []
 
 
+@pytest.mark.parametrize(
+    "id, specification",
+    [
+        ("$id", referencing.jsonschema.DRAFT7),
+        ("$id", referencing.jsonschema.DRAFT6),
+        ("id", referencing.jsonschema.DRAFT4),
+        ("id", referencing.jsonschema.DRAFT3),
+    ],
+)
+def test_legacy_anchors_in(id, specification):
+    assert [
+        anchor.name for anchor in specification.anchors_in({id: "#foo"})
+    ] == ["foo"]
+    assert list(specification.anchors_in({id: "http://example.com"})) == []
+    assert list(specification.anchors_in({})) == []
+
+
 @pytest.mark.parametrize(
     "specification",
     [
@@ -100,6 +121,8 @@ def test_anchors_in_bool(specification, value):
         referencing.jsonschema.DRAFT201909,
         referencing.jsonschema.DRAFT7,
         referencing.jsonschema.DRAFT6,
+        referencing.jsonschema.DRAFT4,
+        referencing.jsonschema.DRAFT3,
     ],
 )
 @pytest.mark.parametrize("value", [True, False])
@@ -107,6 +130,80 @@ def test_subresources_of_bool(specification, value):
     assert list(specification.subresources_of(value)) == []
 
 
+@pytest.mark.parametrize(
+    "specification, contents, expected",
+    [
+        (
+            referencing.jsonschema.DRAFT202012,
+            {"not": {"type": "string"}},
+            [{"type": "string"}],
+        ),
+        (
+            referencing.jsonschema.DRAFT202012,
+            {"allOf": [{"type": "string"}, {"minLength": 3}]},
+            [{"type": "string"}, {"minLength": 3}],
+        ),
+        (
+            referencing.jsonschema.DRAFT202012,
+            {"$defs": {"foo": {"type": "string"}, "bar": {"minLength": 3}}},
+            [{"type": "string"}, {"minLength": 3}],
+        ),
+        (
+            referencing.jsonschema.DRAFT202012,
+            {"type": "string", "minLength": 3},
+            [],
+        ),
+        (
+            referencing.jsonschema.DRAFT201909,
+            {"items": {"type": "string"}},
+            [{"type": "string"}],
+        ),
+        (
+            referencing.jsonschema.DRAFT201909,
+            {"items": [{"type": "string"}, {"minLength": 3}]},
+            [{"type": "string"}, {"minLength": 3}],
+        ),
+        (
+            referencing.jsonschema.DRAFT201909,
+            {"items": None},
+            [],
+        ),
+        (
+            referencing.jsonschema.DRAFT7,
+            {"dependencies": {"foo": {"type": "string"}, "bar": True}},
+            [{"type": "string"}, True],
+        ),
+        (
+            referencing.jsonschema.DRAFT7,
+            {"dependencies": {"foo": ["bar"]}},
+            [],
+        ),
+        (
+            referencing.jsonschema.DRAFT7,
+            {"dependencies": None},
+            [],
+        ),
+        (
+            referencing.jsonschema.DRAFT4,
+            {"additionalProperties": {"type": "string"}},
+            [{"type": "string"}],
+        ),
+        (
+            referencing.jsonschema.DRAFT4,
+            {"additionalProperties": False},
+            [],
+        ),
+        (
+            referencing.jsonschema.DRAFT3,
+            {"extends": [{"type": "string"}]},
+            [{"type": "string"}],
+        ),
+    ],
+)
+def test_subresources_of(specification, contents, expected):
+    assert list(specification.subresources_of(contents)) == expected
+
+
 @pytest.mark.parametrize(
     "uri, expected",
     [
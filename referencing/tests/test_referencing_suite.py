@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 import json
 import os
@@ -25,20 +26,27 @@ else:
     SUITE = Path(__file__).parent.parent.parent / "suite/tests"
 if not SUITE.is_dir():  # pragma: no cover
     raise SuiteNotFound()
-DIALECT_IDS = json.loads(SUITE.joinpath("specifications.json").read_text())
+
+
+@cache
+def dialect_ids():
+    """
+    The suite's dialect IDs, read only once a test actually needs them.
+    """
+    return json.loads(SUITE.joinpath("specifications.json").read_bytes())
 
 
 @pytest.mark.parametrize(
     "test_path",
     [
         pytest.param(each, id=f"{each.parent.name}-{each.stem}")
-        for each in SUITE.glob("*/**/*.json")
+        for each in sorted(SUITE.glob("*/**/*.json"))
     ],
 )
 def test_referencing_suite(test_path, subtests):
-    dialect_id = DIALECT_IDS[test_path.relative_to(SUITE).parts[0]]
+    dialect_id = dialect_ids()[test_path.relative_to(SUITE).parts[0]]
     specification = referencing.jsonschema.specification_with(dialect_id)
-    loaded = json.loads(test_path.read_text())
+    loaded = json.loads(test_path.read_bytes())
     registry = loaded["registry"]
     registry = Registry().with_resources(
         (uri, specification.create_resource(contents))